@@ -1,4 +1,5 @@
 import asyncio
+import logging
 import os
 
 import discord
@@ -10,10 +11,14 @@ from models import Player, Bet
 
 TOKEN = os.environ.get('DISCORD_BOT_TOKEN')
 
+logger = logging.getLogger(__name__)
+
 intents = discord.Intents(messages=True, message_content=True, guilds=True, guild_messages=True, members=True)
 bot = commands.Bot(command_prefix='$', intents=intents)
 
 ROULETTE_SPIN_FREQUENCY_IN_SECONDS = 120
+PLAYERS_DATA_FLUSH_FREQUENCY_IN_SECONDS = 30
+MAX_MESSAGE_LENGTH = 2000
 SPECIFY_COLOR_PARAMETERS_MSG = "Please indicate both the color and the amount: $color [color] [amount]"
 SPECIFY_NUMBER_PARAMETERS_MSG = "Please indicate both the number and the amount: $number [number] [amount]"
 SPIN_THE_WHEEL_MSG = "Spinning the wheel..."
@@ -26,6 +31,29 @@ BALANCE_MSG = "{}'s balance is {} coins."
 roulette_game = RouletteGame()
 
 
+class ColorArg(commands.Converter):
+    """Converter that validates and lowercases a roulette color argument before it reaches the game."""
+
+    async def convert(self, ctx, argument: str) -> str:
+        """
+        Converts the raw argument to a canonical lowercase color.
+
+        Args:
+        - ctx (discord.ext.commands.Context): The invocation context of the command.
+        - argument (str): The raw color argument supplied by the player.
+
+        Raises:
+        - commands.BadArgument: If the argument is not one of the available colors.
+        """
+        color = argument.lower()
+        if color not in RouletteGame.COLORS:
+            raise commands.BadArgument(
+                f"The color '{argument}' you have chosen is not valid. "
+                f"Please choose a color from the available range: {RouletteGame.COLORS}."
+            )
+        return color
+
+
 @bot.command(name="balance", help="Check your balance in the game")
 async def balance(ctx):
     """
@@ -49,7 +77,7 @@ async def bet_number_command(ctx, bet_number: int = None, bet_amount: int = None
     bet_amount: int
         The amount of the bet.
     """
-    if not bet_number or not bet_amount:
+    if bet_number is None or bet_amount is None:
         await ctx.send(SPECIFY_NUMBER_PARAMETERS_MSG)
         return
 
@@ -63,7 +91,7 @@ async def bet_number_command(ctx, bet_number: int = None, bet_amount: int = None
 
 
 @bot.command(name="color", help="Bet on a color in roulette")
-async def bet_color_command(ctx, bet_color: str = None, bet_amount: int = None):
+async def bet_color_command(ctx, bet_color: ColorArg = None, bet_amount: int = None):
     """Command to allow a player to bet on a color in roulette.
 
     Parameters:
@@ -75,7 +103,7 @@ async def bet_color_command(ctx, bet_color: str = None, bet_amount: int = None):
     bet_amount: int
         The amount of the bet.
     """
-    if not bet_color or not bet_amount:
+    if bet_color is None or bet_amount is None:
         await ctx.send(SPECIFY_COLOR_PARAMETERS_MSG)
         return
 
@@ -104,6 +132,9 @@ async def bet_color_or_number_command_error(ctx, error):
         The error that was raised.
     """
     if isinstance(error, commands.BadArgument):
+        if ctx.current_parameter is not None and ctx.current_parameter.annotation is ColorArg:
+            await ctx.send(str(error))
+            return
         message = (
             f"'{ctx.current_argument}' is not valid value for '{ctx.current_parameter.name}' parameter, "
             f"use value of {ctx.current_parameter.annotation} type"
@@ -113,6 +144,12 @@ async def bet_color_or_number_command_error(ctx, error):
 
 bot.remove_command('help')
 
+DEFAULT_HELP_EMBED = discord.Embed(title="Commands", description="List of available commands:")
+DEFAULT_HELP_EMBED.add_field(name="$balance", value="Check your balance in the game.", inline=False)
+DEFAULT_HELP_EMBED.add_field(name="$number [number] [amount]", value="Bet on a number in roulette.", inline=False)
+DEFAULT_HELP_EMBED.add_field(name="$color [red/black] [amount]", value="Bet on a color in roulette.", inline=False)
+DEFAULT_HELP_EMBED.add_field(name="$help [balance/number/color]", value="Help for commands.", inline=False)
+
 
 @bot.command(name="help", help="Get help for a specific command. Usage: $help <command>")
 async def help_command(ctx, command: str = None):
@@ -127,21 +164,15 @@ async def help_command(ctx, command: str = None):
     - None
     """
 
-    embed = discord.Embed(title="Commands", description="List of available commands:")
-    embed.add_field(name="$balance", value="Check your balance in the game.", inline=False)
-    embed.add_field(name="$number [number] [amount]", value="Bet on a number in roulette.", inline=False)
-    embed.add_field(name="$color [red/black] [amount]", value="Bet on a color in roulette.", inline=False)
-    embed.add_field(name="$help [balance/number/color]", value="Help for commands.", inline=False)
-
     if not command:
-        await ctx.send(embed=embed)
+        await ctx.send(embed=DEFAULT_HELP_EMBED)
         return
 
     command_obj = bot.get_command(command)
 
     if not command_obj or command_obj.hidden:
         await ctx.send(f"Command $help '{command}' not found.")
-        await ctx.send(embed=embed)
+        await ctx.send(embed=DEFAULT_HELP_EMBED)
         return
 
     usage_text = f"{ctx.prefix}{command_obj.qualified_name} {command_obj.signature.replace('=None', '')}\n"
@@ -163,9 +194,10 @@ async def on_ready():
     Returns:
         None
     """
-    players = [str(player.id) for player in bot.users]
-    roulette_game.add_players(players)
+    players = (str(player.id) for player in bot.users)
+    await asyncio.to_thread(roulette_game.add_players, players)
     asyncio.create_task(game_loop())
+    asyncio.create_task(flush_loop())
 
 
 @bot.event
@@ -178,24 +210,112 @@ async def on_member_join(member):
 
     """
     players = [str(member.id)]
-    roulette_game.add_players(players)
+    await asyncio.to_thread(roulette_game.add_players, players)
 
 
-async def game_loop():
+async def flush_loop():
     """
-    Coroutine that runs indefinitely, periodically spinning the roulette wheel and sending the results to the players.
+    Coroutine that runs indefinitely, periodically saving players data to disk.
+
+    Balance mutations only update the in-memory state; this loop persists them in batches,
+    running the blocking file write in a thread so the event loop stays free.
+
+    A failed flush (e.g. a full disk) is logged and retried on the next tick instead of killing the loop.
     """
     while True:
-        await asyncio.sleep(ROULETTE_SPIN_FREQUENCY_IN_SECONDS)
+        await asyncio.sleep(PLAYERS_DATA_FLUSH_FREQUENCY_IN_SECONDS)
+        try:
+            await asyncio.to_thread(roulette_game.flush)
+        except Exception:
+            logger.exception("Periodic players data flush failed")
 
-        winning_number = roulette_game.spin_the_wheel()
-        results = roulette_game.calculate_results(winning_number)
 
-        for result in results:
-            channel = bot.get_channel(result.player.channel_id)
-            await channel.send(SPIN_THE_WHEEL_MSG)
-            await channel.send(f"{winning_number} {roulette_game.get_color(winning_number)}")
-            await channel.send(result)
+def join_into_messages(lines):
+    """
+    Joins lines into newline-separated messages that each fit within Discord's message length limit.
+
+    A single line longer than the limit is hard-split into limit-sized pieces,
+    so no returned message ever exceeds it.
+
+    Parameters:
+    -----------
+    lines: list[str]
+        The lines to join.
 
+    Returns:
+    - list[str]: The joined messages, each at most MAX_MESSAGE_LENGTH characters long.
+    """
+    messages = []
+    current = ""
+    for line in lines:
+        while len(line) > MAX_MESSAGE_LENGTH:
+            if current:
+                messages.append(current)
+                current = ""
+            messages.append(line[:MAX_MESSAGE_LENGTH])
+            line = line[MAX_MESSAGE_LENGTH:]
+        if current and len(current) + 1 + len(line) > MAX_MESSAGE_LENGTH:
+            messages.append(current)
+            current = line
+        else:
+            current = f"{current}\n{line}" if current else line
+    if current:
+        messages.append(current)
+    return messages
+
+
+async def send_messages(channel, messages):
+    """
+    Sends the messages to the channel one after another, preserving their order.
+
+    Parameters:
+    -----------
+    channel: discord.TextChannel
+        The channel to send the messages to.
+    messages: list[str]
+        The messages to send.
+    """
+    for message in messages:
+        await channel.send(message)
+
+
+async def game_loop():
+    """
+    Coroutine that runs indefinitely, periodically spinning the roulette wheel and sending the results to the players.
+
+    The results are grouped by channel into a single message per channel and all messages are sent concurrently,
+    so every channel gets exactly one API call per spin and one slow channel does not delay the others.
+
+    A failed spin is logged and the loop carries on with the next one instead of dying.
+    """
+    while True:
+        await asyncio.sleep(ROULETTE_SPIN_FREQUENCY_IN_SECONDS)
 
-bot.run(TOKEN)
+        try:
+            winning_number = roulette_game.spin_the_wheel()
+            winning_color = roulette_game.get_color(winning_number)
+            results = roulette_game.calculate_results(winning_number)
+            await asyncio.to_thread(roulette_game.flush)
+
+            result_lines_by_channel = {}
+            for result in results:
+                result_lines_by_channel.setdefault(result.player.channel_id, []).append(str(result))
+
+            header = f"{SPIN_THE_WHEEL_MSG}\n{SPIN_RESULT_MSG.format(winning_number, winning_color)}"
+            sends = []
+            for channel_id, result_lines in result_lines_by_channel.items():
+                channel = bot.get_channel(channel_id)
+                sends.append(send_messages(channel, join_into_messages([header, *result_lines])))
+            outcomes = await asyncio.gather(*sends, return_exceptions=True)
+            for outcome in outcomes:
+                if isinstance(outcome, Exception):
+                    logger.error("Failed to send spin results: %s", outcome)
+        except Exception:
+            logger.exception("Roulette spin failed")
+
+
+try:
+    bot.run(TOKEN)
+finally:
+    # Persist any balance changes still waiting for the next periodic flush.
+    roulette_game.flush()
@@ -2,10 +2,11 @@ class InsufficientBalanceError(Exception):
     """
     Exception raised when a player tries to place a bet that exceeds their current balance.
 
+    The error message is formatted lazily in __str__, so constructing the exception only stores the raw values.
+
     Attributes:
         balance (int): The current balance of the player.
         bet (int): The amount of coins the player is trying to bet.
-        message (str): The error message.
     """
 
     def __init__(self, balance: int, bet: int):
@@ -18,18 +19,21 @@ class InsufficientBalanceError(Exception):
         """
         self.balance = balance
         self.bet = bet
-        self.message = f"Player's balance {balance} coins is not enough to bet {bet} coins"
-        super().__init__(self.message)
+        super().__init__()
+
+    def __str__(self) -> str:
+        return f"Player's balance {self.balance} coins is not enough to bet {self.bet} coins"
 
 
 class WrongColorError(Exception):
     """
     Exception raised when a player selects an invalid color to bet on.
 
+    The error message is formatted lazily in __str__, so constructing the exception only stores the raw values.
+
     Attributes:
         color (str): The color selected by the player.
         colors (list): The available colors to bet on.
-        message (str): The error message.
     """
 
     def __init__(self, color: str, colors: tuple[str, str]):
@@ -42,20 +46,23 @@ class WrongColorError(Exception):
         """
         self.color = color
         self.colors = colors
-        self.message = (
-            f"The color '{color}' you have chosen is not valid. "
-            f"Please choose a color from the available range: {colors}."
+        super().__init__()
+
+    def __str__(self) -> str:
+        return (
+            f"The color '{self.color}' you have chosen is not valid. "
+            f"Please choose a color from the available range: {self.colors}."
         )
-        super().__init__(self.message)
 
 
 class WrongNumberError(Exception):
     """
     Exception raised when a player selects an invalid number to bet on.
 
+    The error message is formatted lazily in __str__, so constructing the exception only stores the raw values.
+
     Attributes:
         num (int): The number selected by the player.
-        message (str): The error message.
     """
 
     def __init__(self, num: int):
@@ -66,17 +73,20 @@ class WrongNumberError(Exception):
             num (int): The number selected by the player.
         """
         self.num = num
-        self.message = f"The number '{num}' you have selected is not valid. Please choose a number between 0 and 36."
-        super().__init__(self.message)
+        super().__init__()
+
+    def __str__(self) -> str:
+        return f"The number '{self.num}' you have selected is not valid. Please choose a number between 0 and 36."
 
 
 class MinimalBetError(Exception):
     """
     Exception raised when a player tries to place a bet that is below the minimal bet.
 
+    The error message is formatted lazily in __str__, so constructing the exception only stores the raw values.
+
     Attributes:
         minimal_bet (int): The minimal bet allowed.
-        message (str): The error message.
     """
 
     def __init__(self, minimal_bet: int):
@@ -87,5 +97,7 @@ class MinimalBetError(Exception):
             minimal_bet (int): The minimal bet allowed.
         """
         self.minimal_bet = minimal_bet
-        self.message = f"The minimal bet is '{minimal_bet}' coin"
-        super().__init__(self.message)
+        super().__init__()
+
+    def __str__(self) -> str:
+        return f"The minimal bet is '{self.minimal_bet}' coin"
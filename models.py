@@ -1,7 +1,7 @@
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(slots=True)
 class Player:
     """
     A class representing a player in the casino.
@@ -17,7 +17,7 @@ class Player:
     channel_id: int
 
 
-@dataclass
+@dataclass(slots=True)
 class Bet:
     """
     A class representing a bet made by a player in the casino.
@@ -35,7 +35,7 @@ class Bet:
     amount: int
 
 
-@dataclass
+@dataclass(slots=True)
 class PlayerBetResult:
     """Stores the result of a player's bet.
 
@@ -56,42 +56,3 @@ class PlayerBetResult:
             str: The string representation of the object.
         """
         return f"{self.player.name} prize: {self.prize} balance: {self.balance}"
-
-
-class PlayersStats:
-    """
-    A class representing the overall statistics of all players in the casino.
-
-    Attributes:
-        __stats (dict): A dictionary storing the player ID as key and the player's bet result as value.
-    """
-
-    def __init__(self) -> None:
-        """
-        Initializes a new instance of the PlayersStats class.
-        """
-        self.__stats = {}
-
-    def add_result(self, player_bet_result: PlayerBetResult) -> None:
-        """
-        Adds a new player's bet result to the overall statistics.
-
-        Args:
-            player_bet_result (PlayerBetResult): The player's bet result to be added.
-        Returns:
-            None
-        """
-        if item := self.__stats.get(player_bet_result.player.id):
-            item.prize += player_bet_result.prize
-            item.balance = player_bet_result.balance
-        else:
-            self.__stats[player_bet_result.player.id] = player_bet_result
-
-    def get_results(self) -> list:
-        """
-        Returns the overall statistics of all players.
-
-        Returns:
-            list: A list containing all player's bet results in the overall statistics.
-        """
-        return list(self.__stats.values())
@@ -1,4 +1,6 @@
 import json
+import os
+import sqlite3
 from abc import ABC, abstractmethod
 
 
@@ -52,10 +54,56 @@ class PlayersDataManagerFileBased(PlayersDataManager):
 
     def save_players_data(self, players: dict[str:int]) -> None:
         """
-        Save players data to a JSON file.
+        Save players data to a JSON file atomically.
+
+        The data is serialized in memory and written to a temporary file that then replaces
+        users_data.json via os.replace, so an interrupted save can never leave a truncated file
+        behind (load_players_data would otherwise silently reset every balance).
+
+        Args:
+            players (dict[str, int]): A dictionary containing players data to be saved.
+        """
+        serialized = json.dumps(players)
+        with open("users_data.json.tmp", "w") as file:
+            file.write(serialized)
+        os.replace("users_data.json.tmp", "users_data.json")
+
+
+class PlayersDataManagerSQLite(PlayersDataManager):
+    """
+    Players data manager that saves and loads players data from a SQLite database.
+
+    This class implements the abstract methods of PlayersDataManager on top of a SQLite database in WAL mode,
+    so saving touches only the changed pages instead of rewriting a whole file.
+    """
+
+    def __init__(self) -> None:
+        """
+        Opens the database connection and creates the players table if it does not exist.
+        """
+        self.__connection = sqlite3.connect("users_data.db", check_same_thread=False)
+        self.__connection.execute("PRAGMA journal_mode=WAL")
+        self.__connection.execute("CREATE TABLE IF NOT EXISTS players (id TEXT PRIMARY KEY, balance INTEGER)")
+        self.__connection.commit()
+
+    def load_players_data(self) -> dict[str:int]:
+        """
+        Load players data from the SQLite database.
+
+        Returns:
+            dict[str, int]: A dictionary containing players data.
+        """
+        return dict(self.__connection.execute("SELECT id, balance FROM players"))
+
+    def save_players_data(self, players: dict[str:int]) -> None:
+        """
+        Save players data to the SQLite database, updating existing players in place.
 
         Args:
             players (dict[str, int]): A dictionary containing players data to be saved.
         """
-        with open("users_data.json", "w") as file:
-            json.dump(players, file)
+        self.__connection.executemany(
+            "INSERT INTO players (id, balance) VALUES (?, ?) ON CONFLICT(id) DO UPDATE SET balance = excluded.balance",
+            players.items(),
+        )
+        self.__connection.commit()
@@ -1,8 +1,9 @@
 import random
-from typing import Tuple
+import threading
+from typing import FrozenSet, Iterable, Tuple
 
 from exceptions import WrongNumberError, WrongColorError, MinimalBetError, InsufficientBalanceError
-from models import PlayerBetResult, PlayersStats, Bet
+from models import PlayerBetResult, Bet
 from players_data_manager import PlayersDataManager, PlayersDataManagerFileBased
 
 
@@ -16,9 +17,9 @@ class RouletteGame:
         NUMBER_PRIZE_MULTIPLIER (int): The multiplier for winning number bets.
         COLOR_PRIZE_MULTIPLIER (int): The multiplier for winning color bets.
         COLORS (Tuple[str, str]): The available colors for betting.
-        RED_NUMBERS (Tuple[int, ...]): The red numbers on the roulette table.
-        BLACK_NUMBERS (Tuple[int, ...]): The black numbers on the roulette table.
-        GREEN_NUMBERS (Tuple[int, ...]): The green numbers on the roulette table.
+        RED_NUMBERS (FrozenSet[int]): The red numbers on the roulette table.
+        BLACK_NUMBERS (FrozenSet[int]): The black numbers on the roulette table.
+        GREEN_NUMBERS (FrozenSet[int]): The green numbers on the roulette table.
 
     Methods:
         __init__(self, players_data_manager: PlayersDataManager = PlayersDataManagerFileBased):
@@ -30,7 +31,10 @@ class RouletteGame:
         __save_players_data(self):
             Saves players data using data manager.
 
-        add_players(self, players: list[str]):
+        flush(self):
+            Saves players data using data manager if there are unsaved changes.
+
+        add_players(self, players_ids: Iterable[str]):
             Adds new players to the game.
 
         spin_the_wheel(self):
@@ -57,12 +61,15 @@ class RouletteGame:
         calculate_number_prize(self, num: int, winning_number: int, amount: int) -> int:
             Calculates the prize for a winning number bet.
 
-        calculate_color_prize(self, color: str, winning_number: int, amount: int) -> int:
+        calculate_color_prize(self, color: str, winning_color: str, amount: int) -> int:
             Calculates the prize for a winning color bet.
 
         calculate_prize(self, bet, winning_number):
             Calculates the prize for a given bet.
 
+        _calculate_prize(self, bet, winning_number, winning_color):
+            Calculates the prize for a given bet with the winning color already resolved.
+
         calculate_results(self, winning_number: int):
             Calculates the results of the game and returns the statistics for each player.
     """
@@ -76,10 +83,18 @@ class RouletteGame:
     COLORS: Tuple[str, str] = ("red", "black")
 
     # fmt: off
-    RED_NUMBERS: Tuple[int, ...] = (1, 3, 5, 7, 9, 12, 14, 16, 18, 19, 21, 23, 25, 27, 30, 32, 34, 36,)
-    BLACK_NUMBERS: Tuple[int, ...] = (2, 4, 6, 8, 10, 11, 13, 15, 17, 20, 22, 24, 26, 28, 29, 31, 33, 35,)
+    RED_NUMBERS: FrozenSet[int] = frozenset({1, 3, 5, 7, 9, 12, 14, 16, 18, 19, 21, 23, 25, 27, 30, 32, 34, 36})
+    BLACK_NUMBERS: FrozenSet[int] = frozenset({2, 4, 6, 8, 10, 11, 13, 15, 17, 20, 22, 24, 26, 28, 29, 31, 33, 35})
     # fmt: on
-    GREEN_NUMBERS: Tuple[int, ...] = (0,)
+    GREEN_NUMBERS: FrozenSet[int] = frozenset({0})
+
+    # Precomputed number -> color table so get_color is a single tuple index instead of three membership scans.
+    # map() is used because a comprehension in a class body cannot see the class attributes.
+    _COLOR_BY_NUMBER: Tuple[str, ...] = ("green",) + tuple(
+        "red" if is_red else "black" for is_red in map(RED_NUMBERS.__contains__, range(1, 37))
+    )
+
+    __slots__ = ("bets", "__players_data_manager", "__players_data", "__dirty", "__flush_lock", "__getrandbits")
 
     def __init__(self, players_data_manager: PlayersDataManager = PlayersDataManagerFileBased) -> None:
         """
@@ -92,6 +107,11 @@ class RouletteGame:
         self.bets = []
         self.__players_data_manager = players_data_manager()
         self.__players_data = self.__load_players_data()
+        self.__dirty = False
+        self.__flush_lock = threading.Lock()
+        # Bound method of a private Random instance, so spins skip the module-level
+        # attribute lookup and the lock shared with other random users.
+        self.__getrandbits = random.Random().getrandbits
 
     def __load_players_data(self) -> dict[str:int]:
         """
@@ -106,34 +126,70 @@ class RouletteGame:
         """
         Saves players data using data manager.
 
+        A snapshot copy of the players data is handed to the manager, so serialization never
+        iterates a dict that another thread (e.g. a to_thread add_players call) is mutating.
+
+        Returns:
+            None
+        """
+        self.__players_data_manager.save_players_data(players=dict(self.__players_data))
+
+    def flush(self) -> None:
+        """
+        Saves players data using data manager if there are unsaved changes.
+
+        Balance mutations only mark the in-memory data as dirty; this method performs
+        the actual write so that many mutations amortize into a single save.
+
+        A lock serializes the dirty check, the flag reset and the save, since flushes
+        can run concurrently from the periodic flush task, player registration and
+        the post-settlement flush, all of which write to the same file.
+
+        The dirty flag is cleared before the save: balance mutations on the event-loop
+        thread do not take the lock, so one landing mid-save re-marks the data dirty
+        and is picked up by the next flush instead of having its mark erased.
+
         Returns:
             None
         """
-        self.__players_data_manager.save_players_data(players=self.__players_data)
+        with self.__flush_lock:
+            if self.__dirty:
+                self.__dirty = False
+                self.__save_players_data()
 
-    def add_players(self, players_ids: list[str]) -> None:
+    def add_players(self, players_ids: Iterable[str]) -> None:
         """
-        Adds new players to the game.
+        Adds new players to the game with the starting balance, skipping known ones.
 
         Args:
-            players_ids (list[str]): A list of player IDs to be added.
+            players_ids (Iterable[str]): The player IDs to be added.
 
         Returns:
             None
         """
+        players_data = self.__players_data
+        known_players = len(players_data)
         for player_id in players_ids:
-            if player_id not in self.__players_data:
-                self.__players_data[player_id] = 100
-        self.__save_players_data()
+            players_data.setdefault(player_id, self.STARTING_BALANCE)
+        if len(players_data) != known_players:
+            self.__dirty = True
+        self.flush()
 
     def spin_the_wheel(self) -> int:
         """Simulates a spin of a roulette wheel and returns the result as an integer from 0 to 36.
 
+        Draws 6 random bits and rejects values above 36, which skips the extra
+        bookkeeping inside random.randint.
+
         Returns:
             int: The result of the spin.
 
         """
-        return random.randint(0, 36)
+        getrandbits = self.__getrandbits
+        result = getrandbits(6)
+        while result > 36:
+            result = getrandbits(6)
+        return result
 
     def has_sufficient_funds(self, player_id: str, amount: int) -> bool:
         """Checks whether a player has sufficient funds to make a bet.
@@ -145,35 +201,44 @@ class RouletteGame:
         Returns:
             bool: True if the player has sufficient funds, False otherwise.
         """
-        return (self.get_player_balance(player_id) - amount) >= 0
+        return self.get_player_balance(player_id) >= amount
 
     def place_bet(self, bet: Bet) -> None:
         """Places a bet on the roulette table.
 
         This function takes a Bet object as an argument and adds it to the list of bets on the table.
-        The function also checks that the color of the bet is valid and that the amount of the bet is greater than zero.
-        If the color of the bet is not valid, a WrongColorError is raised.
-        If the bet amount is less than or equal to zero, a MinimalBetError is raised.
+        The amount is checked against the minimal bet first, as the cheapest validation.
+        The bet's color is normalized to lowercase here, so the settlement code can compare colors directly.
+        Number bets (including 0) are validated as roulette numbers; color bets are validated against
+        the available colors.
+        If the bet amount is below the minimal bet, a MinimalBetError is raised.
+        If a number bet is not a valid roulette number, a WrongNumberError is raised.
+        If the color of a color bet is not valid, a WrongColorError is raised.
         If the player does not have sufficient funds, an InsufficientFundsError is raised.
 
         Args:
             bet (models.Bet): The bet to be placed on the table.
 
         Raises:
-            WrongColorError: If the color of the bet is not valid.
-            MinimalBetError: If the bet amount is less than or equal to zero.
+            WrongNumberError: If a number bet is not a valid roulette number.
+            WrongColorError: If the color of a color bet is not valid.
+            MinimalBetError: If the bet amount is below the minimal bet.
             InsufficientFundsError: If the player does not have sufficient funds.
 
         Returns:
             None.
         """
-        color = self.get_color(bet.number) if bet.number else bet.color
-
-        if color.lower() not in self.COLORS:
-            raise WrongColorError(color, self.COLORS)
-        if bet.amount <= 0:
+        if bet.amount < self.MINIMAL_BET:
             raise MinimalBetError(self.MINIMAL_BET)
 
+        if bet.color is not None:
+            bet.color = bet.color.lower()
+
+        if bet.number is not None:
+            self.get_color(bet.number)
+        elif bet.color not in self.COLORS:
+            raise WrongColorError(bet.color, self.COLORS)
+
         self.subtract_from_balance(bet.player.id, bet.amount)
         self.bets.append(bet)
 
@@ -181,7 +246,7 @@ class RouletteGame:
         """Returns the color of a number on the roulette table.
 
         This function takes an integer argument and returns the color of the corresponding number on the roulette table.
-        The function checks whether the number is a red, black, or green number and returns the corresponding color.
+        The color is looked up in a precomputed table indexed by the number.
         If the number is not valid, a WrongNumberError is raised.
 
         Args:
@@ -193,12 +258,8 @@ class RouletteGame:
         Returns:
             str: The color of the number (either 'red', 'black', or 'green').
         """
-        if num in self.RED_NUMBERS:
-            return "red"
-        elif num in self.BLACK_NUMBERS:
-            return "black"
-        elif num in self.GREEN_NUMBERS:
-            return "green"
+        if 0 <= num < len(self._COLOR_BY_NUMBER):
+            return self._COLOR_BY_NUMBER[num]
         raise WrongNumberError(num)
 
     def add_to_balance(self, player_id: str, amount: int) -> None:
@@ -207,7 +268,7 @@ class RouletteGame:
         This function takes a player ID and an integer amount as arguments,
         and adds the specified amount to the player's balance.
 
-        The updated balance is then saved to the players data file.
+        The updated balance is kept in memory and persisted on the next flush.
 
         Args:
             player_id (str): The ID of the player whose balance will be updated.
@@ -217,7 +278,7 @@ class RouletteGame:
         """
         player_balance = self.get_player_balance(player_id)
         self.__players_data[player_id] = player_balance + amount
-        self.__save_players_data()
+        self.__dirty = True
 
     def subtract_from_balance(self, player_id: str, amount: int) -> None:
         """Subtracts the specified amount from a player's balance.
@@ -228,7 +289,7 @@ class RouletteGame:
         The function first checks whether the player has sufficient funds to cover the bet,
         and raises an InsufficientBalanceError if the balance is not sufficient.
 
-        The updated balance is then saved to the players data file.
+        The updated balance is kept in memory and persisted on the next flush.
 
         Args:
             player_id (str): The ID of the player whose balance will be updated.
@@ -240,10 +301,11 @@ class RouletteGame:
         Returns:
             None
         """
-        if not self.has_sufficient_funds(player_id, amount):
-            raise InsufficientBalanceError(self.get_player_balance(player_id), amount)
-        self.__players_data[player_id] -= amount
-        self.__save_players_data()
+        balance = self.get_player_balance(player_id)
+        if balance < amount:
+            raise InsufficientBalanceError(balance, amount)
+        self.__players_data[player_id] = balance - amount
+        self.__dirty = True
 
     def get_player_balance(self, player_id: str) -> int:
         """Retrieves the current balance of a player.
@@ -280,26 +342,26 @@ class RouletteGame:
         """
         return amount * self.NUMBER_PRIZE_MULTIPLIER if num == winning_number else 0
 
-    def calculate_color_prize(self, color: str, winning_number: int, amount: int) -> int:
+    def calculate_color_prize(self, color: str, winning_color: str, amount: int) -> int:
         """Calculates the prize amount for a color bet.
 
-        This function takes a color bet, the winning number, and the bet amount as arguments,
+        This function takes a color bet, the winning color, and the bet amount as arguments,
         and calculates the prize amount for the bet.
 
-        If the color bet matches the color of the winning number,
+        If the color bet matches the winning color,
         the function returns the bet amount multiplied by the color prize multiplier.
 
         Otherwise, the function returns 0.
 
         Args:
             color (str): The color that was bet on ('red', 'black', or None for green).
-            winning_number (int): The winning number.
+            winning_color (str): The color of the winning number.
             amount (int): The bet amount.
 
         Returns:
             int: The prize amount for the color bet.
         """
-        return amount * self.COLOR_PRIZE_MULTIPLIER if color and color.lower() == self.get_color(winning_number) else 0
+        return amount * self.COLOR_PRIZE_MULTIPLIER if color == winning_color else 0
 
     def calculate_prize(self, bet: Bet, winning_number: int) -> int:
         """Calculates the prize amount for a given bet and winning number.
@@ -316,22 +378,42 @@ class RouletteGame:
         Returns:
             int: The prize amount for the bet.
         """
-        if bet.number:
+        return self._calculate_prize(bet, winning_number, self.get_color(winning_number))
+
+    def _calculate_prize(self, bet: Bet, winning_number: int, winning_color: str) -> int:
+        """Calculates the prize amount for a given bet with the winning color already resolved.
+
+        Internal variant of calculate_prize used by calculate_results, which settles a whole
+        batch of bets against the same spin and therefore resolves the winning color only once.
+
+        Args:
+            bet (Bet): A Bet object representing the bet.
+            winning_number (int): The winning number.
+            winning_color (str): The color of the winning number.
+
+        Returns:
+            int: The prize amount for the bet.
+        """
+        if bet.number is not None:
             return self.calculate_number_prize(bet.number, winning_number, bet.amount)
-        return self.calculate_color_prize(bet.color, winning_number, bet.amount)
+        return self.calculate_color_prize(bet.color, winning_color, bet.amount)
 
     # TODO: Refactor to split updating balance and sending results
-    def calculate_results(self, winning_number: int) -> list:
+    def calculate_results(self, winning_number: int) -> list[PlayerBetResult]:
         """Calculates and returns the results of the game.
 
         This function takes the winning number as an argument
         and calculates the results of the game based on the bets placed.
 
-        It iterates through the list of bets placed and calculates the prize amount for each bet
-        using the calculate_prize function.
+        It iterates through the list of bets placed, calculates the prize amount for each bet
+        and accumulates the prizes per player.
+
+        The accumulated prizes are then applied to the player balances in a single pass
+        and returned as one PlayerBetResult per player. The updates are applied in memory
+        and marked dirty; the caller persists them with a single flush() afterwards.
 
-        It then adds the prize amount to the player's balance using the add_to_balance function,
-        and adds the result to the PlayersStats object.
+        The common case of a single placed bet takes a fast path that settles it directly,
+        without the accumulator dicts.
 
         The function returns a list of PlayerBetResult objects, containing the results of the game for each player.
 
@@ -339,13 +421,34 @@ class RouletteGame:
             winning_number (int): The winning number.
 
         Returns:
-            list: A list of PlayerBetResult objects, containing the results of the game for each player.
+            list[PlayerBetResult]: The PlayerBetResult objects, containing the results of the game for each player.
         """
-        players_stats = PlayersStats()
-        while self.bets:
+        winning_color = self.get_color(winning_number)
+
+        if len(self.bets) == 1:
             bet = self.bets.pop()
-            prize = self.calculate_prize(bet, winning_number)
-            self.add_to_balance(bet.player.id, prize)
-            balance = self.get_player_balance(bet.player.id)
-            players_stats.add_result(PlayerBetResult(bet.player, prize, balance))
-        return players_stats.get_results()
+            prize = self._calculate_prize(bet, winning_number, winning_color)
+            balance = self.__players_data.get(bet.player.id, 0) + prize
+            self.__players_data[bet.player.id] = balance
+            self.__dirty = True
+            return [PlayerBetResult(bet.player, prize, balance)]
+
+        prizes = {}
+        players = {}
+        calculate_prize = self._calculate_prize
+        accumulated = prizes.get
+        for bet in self.bets:
+            player_id = bet.player.id
+            prizes[player_id] = accumulated(player_id, 0) + calculate_prize(bet, winning_number, winning_color)
+            players[player_id] = bet.player
+        self.bets.clear()
+
+        results = []
+        players_data = self.__players_data
+        for player_id, prize in prizes.items():
+            balance = players_data.get(player_id, 0) + prize
+            players_data[player_id] = balance
+            results.append(PlayerBetResult(players[player_id], prize, balance))
+        if prizes:
+            self.__dirty = True
+        return results